@@ -1,4 +1,5 @@
 import os
+import codecs
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import markdown
@@ -8,6 +9,89 @@ import tempfile
 import shutil
 from datetime import datetime
 
+# Encoding detection / decoding settings
+SNIFF_SIZE = 64 * 1024      # Bytes inspected to pick an encoding
+CHUNK_SIZE = 1024 * 1024    # Bytes decoded per read
+FALLBACK_ENCODING = 'latin-1'
+
+# Longest BOMs first so UTF-32 LE is not mistaken for UTF-16 LE
+BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+def detect_encoding(prefix):
+    """Guess the encoding of a file from the first bytes of its content"""
+    for bom, encoding in BOMS:
+        if prefix.startswith(bom):
+            return encoding
+    
+    # UTF-16 without a BOM: ASCII text leaves a NUL in every other byte
+    if len(prefix) >= 2:
+        even_nuls = prefix[0::2].count(0)
+        odd_nuls = prefix[1::2].count(0)
+        half = len(prefix) // 2
+        if odd_nuls > half * 0.3 and even_nuls < half * 0.05:
+            return 'utf-16-le'
+        if even_nuls > half * 0.3 and odd_nuls < half * 0.05:
+            return 'utf-16-be'
+    
+    # A prefix cut in the middle of a multi-byte sequence is still valid UTF-8
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(prefix, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+
+
+def decode_file(file_path, encoding):
+    """Decode a file in fixed-size chunks, normalizing newlines to '\\n'"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parts = []
+    pending_cr = False
+    
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            final = not chunk
+            text = decoder.decode(chunk, final=final)
+            
+            if pending_cr:
+                text = '\r' + text
+            # Hold back a trailing '\r' in case its '\n' is in the next chunk
+            pending_cr = not final and text.endswith('\r')
+            if pending_cr:
+                text = text[:-1]
+            
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            parts.append(text)
+            
+            if final:
+                break
+    
+    return ''.join(parts)
+
+
+def read_text_file(file_path):
+    """Read a text file of unknown encoding, returning (content, encoding)"""
+    with open(file_path, 'rb') as f:
+        prefix = f.read(SNIFF_SIZE)
+    
+    encoding = detect_encoding(prefix)
+    try:
+        return decode_file(file_path, encoding), encoding
+    except UnicodeDecodeError:
+        # Only the prefix was sniffed; a later invalid byte means it was not UTF-8
+        if encoding != 'utf-8':
+            raise
+        return decode_file(file_path, FALLBACK_ENCODING), FALLBACK_ENCODING
+
+
 class MarkdownVisualizerGUI:
     def __init__(self, root):
         self.root = root
@@ -189,8 +273,13 @@ class MarkdownVisualizerGUI:
         )
         
         if file_paths:
+            errors = []
             for file_path in file_paths:
-                self.load_file(file_path)
+                self.load_file(file_path, errors)
+            
+            self.update_file_list()
+            self.update_status()
+            self.show_load_errors(errors)
     
     def upload_folder(self):
         """Upload all markdown files from a folder"""
@@ -198,44 +287,73 @@ class MarkdownVisualizerGUI:
         
         if folder_path:
             md_files_found = 0
+            errors = []
             try:
                 for filename in os.listdir(folder_path):
                     if filename.lower().endswith(('.md', '.markdown')):
                         file_path = os.path.join(folder_path, filename)
-                        self.load_file(file_path)
+                        self.load_file(file_path, errors)
                         md_files_found += 1
                 
+                self.update_file_list()
+                self.update_status()
+                
                 if md_files_found == 0:
                     messagebox.showwarning("No Files", "No markdown files found in the selected folder.")
+                elif errors:
+                    self.show_load_errors(errors)
                 else:
                     messagebox.showinfo("Success", f"Loaded {md_files_found} markdown files from folder!")
                     
             except Exception as e:
                 messagebox.showerror("Error", f"Error loading folder: {str(e)}")
     
-    def load_file(self, file_path):
-        """Load a single file into memory"""
+    def load_file(self, file_path, errors=None):
+        """Load a single file into memory
+        
+        When an ``errors`` list is given (batch uploads), failures are appended
+        to it and the file list is left for the caller to refresh once.
+        """
+        filename = os.path.basename(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            filename = os.path.basename(file_path)
+            content, encoding = read_text_file(file_path)
             
             # Store file content
             self.uploaded_files[filename] = {
                 'content': content,
                 'path': file_path,
+                'encoding': encoding,
                 'upload_time': datetime.now()
             }
             
+        except Exception as e:
+            if errors is None:
+                messagebox.showerror("Error", f"Error loading file {filename}:\n{str(e)}")
+            else:
+                errors.append((filename, str(e)))
+            return False
+        
+        if errors is None:
             # Update file list
             self.update_file_list()
             
             # Update status
             self.update_status()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error loading file {os.path.basename(file_path)}:\n{str(e)}")
+        
+        return True
+    
+    def show_load_errors(self, errors):
+        """Show a single summary of files that failed to load"""
+        if not errors:
+            return
+        
+        shown = errors[:20]
+        lines = [f"• {filename}: {message}" for filename, message in shown]
+        if len(errors) > len(shown):
+            lines.append(f"... and {len(errors) - len(shown)} more")
+        
+        messagebox.showwarning("Some Files Failed",
+                               f"{len(errors)} file(s) could not be loaded:\n\n" + "\n".join(lines))
     
     def update_file_list(self):
         """Update the file listbox"""
@@ -298,6 +416,7 @@ class MarkdownVisualizerGUI:
 📄 File: {filename}
 📅 Uploaded: {file_data['upload_time'].strftime("%Y-%m-%d %H:%M:%S")}
 📍 Original Path: {file_data['path']}
+🔤 Encoding: {file_data.get('encoding', 'utf-8')}
 📏 Size: {len(content)} characters
 📝 Lines: {len(content.splitlines())} lines
 